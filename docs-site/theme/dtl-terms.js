@@ -1,454 +1,6 @@
 (() => {
-  const payload = {
-  "target_pages": [
-    "/reference/language-guide.html",
-    "/reference/language-spec.html",
-    "/reference/troubleshooting.html",
-    "/tutorial/quickstart.html",
-    "/tutorial/first-policy.html"
-  ],
-  "terms": [
-    {
-      "id": "sort",
-      "label": "sort",
-      "aliases": [],
-      "short_tip": "開集合のドメイン軸を宣言する型フォーム。",
-      "definition": "値集合を列挙せず、ドメイン軸の型名だけを定義するトップレベル宣言。",
-      "category": "dsl-keyword",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "data",
-      "label": "data",
-      "aliases": [],
-      "short_tip": "constructor 群で閉集合の語彙を定義する ADT 宣言。",
-      "definition": "許可する値集合を constructor で固定し、語彙統制を行うトップレベル宣言。",
-      "category": "dsl-keyword",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "relation",
-      "label": "relation",
-      "aliases": [],
-      "short_tip": "述語シグネチャを宣言する論理知識の入口。",
-      "definition": "事実や規則で利用する述語名と引数型を宣言するトップレベルフォーム。",
-      "category": "dsl-keyword",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "fact",
-      "label": "fact",
-      "aliases": [],
-      "short_tip": "relation に対する具体的事実を与える宣言。",
-      "definition": "述語が成り立つ具体値の組を追加し、推論の基底を提供するトップレベルフォーム。",
-      "category": "dsl-keyword",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "rule",
-      "label": "rule",
-      "aliases": [],
-      "short_tip": "relation の導出条件を記述する推論規則。",
-      "definition": "ヘッド述語がボディ条件から導かれることを定義する論理ルール。",
-      "category": "dsl-keyword",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/quickstart.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "assert",
-      "label": "assert",
-      "aliases": [],
-      "short_tip": "常に成り立つべきグローバル制約を宣言。",
-      "definition": "証明フェーズで義務化される論理条件を定義するトップレベルフォーム。",
-      "category": "dsl-keyword",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/quickstart.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "universe",
-      "label": "universe",
-      "aliases": [],
-      "short_tip": "有限モデル検証の値境界を与える宣言。",
-      "definition": "量化対象型ごとに有限値集合を与え、prove の全探索空間を定義するフォーム。",
-      "category": "dsl-keyword",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "defn",
-      "label": "defn",
-      "aliases": [],
-      "short_tip": "型付き純粋関数を定義するフォーム。",
-      "definition": "引数型・戻り型を明示し、構造再帰制約下で純粋関数を定義するトップレベルフォーム。",
-      "category": "dsl-keyword",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/quickstart.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "match",
-      "label": "match",
-      "aliases": [],
-      "short_tip": "ADT/Bool を分岐分解する式。",
-      "definition": "constructor や真偽値ごとの分岐を記述し、網羅性・到達不能性の検査対象になる式。",
-      "category": "dsl-keyword",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html"
-      ]
-    },
-    {
-      "id": "check",
-      "label": "check",
-      "aliases": [],
-      "short_tip": "構文・名前解決・型などの静的検査コマンド。",
-      "definition": "プログラムを実行せず、構文/名前解決/型/全域性/match 検査を行う CLI サブコマンド。",
-      "category": "cli-subcommand",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/quickstart.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "prove",
-      "label": "prove",
-      "aliases": [],
-      "short_tip": "有限モデル上で証明義務を検証するコマンド。",
-      "definition": "assert と Refine 契約を universe に基づいて全探索検証する CLI サブコマンド。",
-      "category": "cli-subcommand",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/quickstart.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "doc",
-      "label": "doc",
-      "aliases": [],
-      "short_tip": "証明成功時のみ仕様成果物を出力するコマンド。",
-      "definition": "未証明義務がない場合に限り、spec/proof-trace/doc-index を生成する CLI サブコマンド。",
-      "category": "cli-subcommand",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/quickstart.html"
-      ]
-    },
-    {
-      "id": "lint",
-      "label": "lint",
-      "aliases": [],
-      "short_tip": "重複候補と未使用宣言を検出するコマンド。",
-      "definition": "L-DUP 系と L-UNUSED-DECL を warning として報告する CLI サブコマンド。",
-      "category": "cli-subcommand",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/quickstart.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "fmt",
-      "label": "fmt",
-      "aliases": [],
-      "short_tip": "Surface 形式へ正規化整形するコマンド。",
-      "definition": "AST 正規化に基づき idempotent な整形を行う CLI サブコマンド。",
-      "category": "cli-subcommand",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/quickstart.html"
-      ]
-    },
-    {
-      "id": "refine",
-      "label": "Refine",
-      "aliases": [],
-      "short_tip": "論理式で値を制約する精密化型。",
-      "definition": "base 型の値に対して論理述語を課す型コンストラクタで、証明義務生成に関与する。",
-      "category": "type-system",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html"
-      ]
-    },
-    {
-      "id": "strict-subterm",
-      "label": "strict subterm",
-      "aliases": [],
-      "short_tip": "再帰呼び出しで元引数より真に小さい部分値。",
-      "definition": "match 分解で得た子要素など、構造的に減少していることを示す ADT 部分項。",
-      "category": "semantics",
-      "match_mode": "exact",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html"
-      ]
-    },
-    {
-      "id": "tail-position",
-      "label": "tail position",
-      "aliases": [],
-      "short_tip": "式評価の最終位置で結果をそのまま返す場所。",
-      "definition": "追加計算を伴わず、呼び出し結果がそのまま関数結果になる式位置。",
-      "category": "semantics",
-      "match_mode": "exact",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html"
-      ]
-    },
-    {
-      "id": "semantic-dup",
-      "label": "semantic-dup",
-      "aliases": [],
-      "short_tip": "有限モデル上の意味同値で重複候補を検出するモード。",
-      "definition": "構文一致ではなく評価結果の同値性を使って重複候補を検出する lint オプション。",
-      "category": "semantics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/quickstart.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "e-parse",
-      "label": "E-PARSE",
-      "aliases": [],
-      "short_tip": "構文不正を示す診断コード。",
-      "definition": "S 式の括弧不整合やフォーム構造崩れなど、構文解析段階の失敗を示すエラーコード。",
-      "category": "diagnostics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html"
-      ]
-    },
-    {
-      "id": "e-syntax-auto",
-      "label": "E-SYNTAX-AUTO",
-      "aliases": [],
-      "short_tip": "Core/Surface 自動判定衝突を示す診断コード。",
-      "definition": "syntax:auto で同一ファイルに Core と Surface が混在したときに返るエラーコード。",
-      "category": "diagnostics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html"
-      ]
-    },
-    {
-      "id": "e-resolve",
-      "label": "E-RESOLVE",
-      "aliases": [],
-      "short_tip": "名前解決失敗を示す診断コード。",
-      "definition": "未定義識別子、重複定義、unsafe rule などの名前解決違反を示すエラーコード。",
-      "category": "diagnostics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "e-type",
-      "label": "E-TYPE",
-      "aliases": [],
-      "short_tip": "型不一致を示す診断コード。",
-      "definition": "関数引数/戻り値、relation 引数、条件式などの型整合性違反を示すエラーコード。",
-      "category": "diagnostics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "e-total",
-      "label": "E-TOTAL",
-      "aliases": [],
-      "short_tip": "停止性/全域性違反を示す診断コード。",
-      "definition": "非 tail 再帰、非減少再帰、相互再帰など全域性条件違反を示すエラーコード。",
-      "category": "diagnostics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html"
-      ]
-    },
-    {
-      "id": "e-match",
-      "label": "E-MATCH",
-      "aliases": [],
-      "short_tip": "match 検査違反を示す診断コード。",
-      "definition": "分岐非網羅、到達不能分岐、パターン型不一致を示すエラーコード。",
-      "category": "diagnostics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html"
-      ]
-    },
-    {
-      "id": "e-prove",
-      "label": "E-PROVE",
-      "aliases": [],
-      "short_tip": "証明失敗または universe 不備を示す診断コード。",
-      "definition": "有限モデル検証での反例検出や必須 universe 欠落による失敗を示すエラーコード。",
-      "category": "diagnostics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html"
-      ]
-    },
-    {
-      "id": "l-dup-exact",
-      "label": "L-DUP-EXACT",
-      "aliases": [],
-      "short_tip": "構文正規化後に確定した重複警告。",
-      "definition": "正規化済みフォームが同一であることを根拠に重複と判定された lint コード。",
-      "category": "diagnostics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html"
-      ]
-    },
-    {
-      "id": "l-dup-maybe",
-      "label": "L-DUP-MAYBE",
-      "aliases": [],
-      "short_tip": "意味同値にもとづく重複候補警告。",
-      "definition": "有限モデルでの双方向検証結果から、重複の可能性を示す lint コード。",
-      "category": "diagnostics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/quickstart.html"
-      ]
-    },
-    {
-      "id": "l-dup-skip-universe",
-      "label": "L-DUP-SKIP-UNIVERSE",
-      "aliases": [],
-      "short_tip": "universe 不足で semantic-dup 判定を省略した警告。",
-      "definition": "必要な universe が不足し、重複候補の意味検証を実施できなかったことを示す lint コード。",
-      "category": "diagnostics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html",
-        "/tutorial/first-policy.html"
-      ]
-    },
-    {
-      "id": "l-dup-skip-eval-depth",
-      "label": "L-DUP-SKIP-EVAL-DEPTH",
-      "aliases": [],
-      "short_tip": "評価深さ上限到達で入力点を省略した警告。",
-      "definition": "defn 比較時に再帰評価が深さ上限へ達し、判定対象の一部をスキップしたことを示す lint コード。",
-      "category": "diagnostics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html",
-        "/reference/troubleshooting.html"
-      ]
-    },
-    {
-      "id": "l-unused-decl",
-      "label": "L-UNUSED-DECL",
-      "aliases": [],
-      "short_tip": "未参照宣言を示す警告コード。",
-      "definition": "relation/sort/data などの宣言が参照されていないことを示す lint コード。",
-      "category": "diagnostics",
-      "match_mode": "token",
-      "enabled_pages": [
-        "/reference/language-guide.html",
-        "/reference/language-spec.html"
-      ]
-    }
-  ]
-};
+  const payload = JSON.parse("{\"target_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/quickstart.html\",\"/tutorial/first-policy.html\"],\"terms\":[{\"id\":\"sort\",\"label\":\"sort\",\"aliases\":[],\"short_tip\":\"開集合のドメイン軸を宣言する型フォーム。\",\"definition\":\"値集合を列挙せず、ドメイン軸の型名だけを定義するトップレベル宣言。\",\"category\":\"dsl-keyword\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"data\",\"label\":\"data\",\"aliases\":[],\"short_tip\":\"constructor 群で閉集合の語彙を定義する ADT 宣言。\",\"definition\":\"許可する値集合を constructor で固定し、語彙統制を行うトップレベル宣言。\",\"category\":\"dsl-keyword\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"relation\",\"label\":\"relation\",\"aliases\":[],\"short_tip\":\"述語シグネチャを宣言する論理知識の入口。\",\"definition\":\"事実や規則で利用する述語名と引数型を宣言するトップレベルフォーム。\",\"category\":\"dsl-keyword\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"fact\",\"label\":\"fact\",\"aliases\":[],\"short_tip\":\"relation に対する具体的事実を与える宣言。\",\"definition\":\"述語が成り立つ具体値の組を追加し、推論の基底を提供するトップレベルフォーム。\",\"category\":\"dsl-keyword\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"rule\",\"label\":\"rule\",\"aliases\":[],\"short_tip\":\"relation の導出条件を記述する推論規則。\",\"definition\":\"ヘッド述語がボディ条件から導かれることを定義する論理ルール。\",\"category\":\"dsl-keyword\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/quickstart.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"assert\",\"label\":\"assert\",\"aliases\":[],\"short_tip\":\"常に成り立つべきグローバル制約を宣言。\",\"definition\":\"証明フェーズで義務化される論理条件を定義するトップレベルフォーム。\",\"category\":\"dsl-keyword\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/quickstart.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"universe\",\"label\":\"universe\",\"aliases\":[],\"short_tip\":\"有限モデル検証の値境界を与える宣言。\",\"definition\":\"量化対象型ごとに有限値集合を与え、prove の全探索空間を定義するフォーム。\",\"category\":\"dsl-keyword\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"defn\",\"label\":\"defn\",\"aliases\":[],\"short_tip\":\"型付き純粋関数を定義するフォーム。\",\"definition\":\"引数型・戻り型を明示し、構造再帰制約下で純粋関数を定義するトップレベルフォーム。\",\"category\":\"dsl-keyword\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/quickstart.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"match\",\"label\":\"match\",\"aliases\":[],\"short_tip\":\"ADT/Bool を分岐分解する式。\",\"definition\":\"constructor や真偽値ごとの分岐を記述し、網羅性・到達不能性の検査対象になる式。\",\"category\":\"dsl-keyword\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\"]},{\"id\":\"check\",\"label\":\"check\",\"aliases\":[],\"short_tip\":\"構文・名前解決・型などの静的検査コマンド。\",\"definition\":\"プログラムを実行せず、構文/名前解決/型/全域性/match 検査を行う CLI サブコマンド。\",\"category\":\"cli-subcommand\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/quickstart.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"prove\",\"label\":\"prove\",\"aliases\":[],\"short_tip\":\"有限モデル上で証明義務を検証するコマンド。\",\"definition\":\"assert と Refine 契約を universe に基づいて全探索検証する CLI サブコマンド。\",\"category\":\"cli-subcommand\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/quickstart.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"doc\",\"label\":\"doc\",\"aliases\":[],\"short_tip\":\"証明成功時のみ仕様成果物を出力するコマンド。\",\"definition\":\"未証明義務がない場合に限り、spec/proof-trace/doc-index を生成する CLI サブコマンド。\",\"category\":\"cli-subcommand\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/quickstart.html\"]},{\"id\":\"lint\",\"label\":\"lint\",\"aliases\":[],\"short_tip\":\"重複候補と未使用宣言を検出するコマンド。\",\"definition\":\"L-DUP 系と L-UNUSED-DECL を warning として報告する CLI サブコマンド。\",\"category\":\"cli-subcommand\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/quickstart.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"fmt\",\"label\":\"fmt\",\"aliases\":[],\"short_tip\":\"Surface 形式へ正規化整形するコマンド。\",\"definition\":\"AST 正規化に基づき idempotent な整形を行う CLI サブコマンド。\",\"category\":\"cli-subcommand\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/troubleshooting.html\",\"/tutorial/quickstart.html\"]},{\"id\":\"refine\",\"label\":\"Refine\",\"aliases\":[],\"short_tip\":\"論理式で値を制約する精密化型。\",\"definition\":\"base 型の値に対して論理述語を課す型コンストラクタで、証明義務生成に関与する。\",\"category\":\"type-system\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\"]},{\"id\":\"strict-subterm\",\"label\":\"strict subterm\",\"aliases\":[],\"short_tip\":\"再帰呼び出しで元引数より真に小さい部分値。\",\"definition\":\"match 分解で得た子要素など、構造的に減少していることを示す ADT 部分項。\",\"category\":\"semantics\",\"match_mode\":\"exact\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\"]},{\"id\":\"tail-position\",\"label\":\"tail position\",\"aliases\":[],\"short_tip\":\"式評価の最終位置で結果をそのまま返す場所。\",\"definition\":\"追加計算を伴わず、呼び出し結果がそのまま関数結果になる式位置。\",\"category\":\"semantics\",\"match_mode\":\"exact\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\"]},{\"id\":\"semantic-dup\",\"label\":\"semantic-dup\",\"aliases\":[],\"short_tip\":\"有限モデル上の意味同値で重複候補を検出するモード。\",\"definition\":\"構文一致ではなく評価結果の同値性を使って重複候補を検出する lint オプション。\",\"category\":\"semantics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/quickstart.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"e-parse\",\"label\":\"E-PARSE\",\"aliases\":[],\"short_tip\":\"構文不正を示す診断コード。\",\"definition\":\"S 式の括弧不整合やフォーム構造崩れなど、構文解析段階の失敗を示すエラーコード。\",\"category\":\"diagnostics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\"]},{\"id\":\"e-syntax-auto\",\"label\":\"E-SYNTAX-AUTO\",\"aliases\":[],\"short_tip\":\"Core/Surface 自動判定衝突を示す診断コード。\",\"definition\":\"syntax:auto で同一ファイルに Core と Surface が混在したときに返るエラーコード。\",\"category\":\"diagnostics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\"]},{\"id\":\"e-resolve\",\"label\":\"E-RESOLVE\",\"aliases\":[],\"short_tip\":\"名前解決失敗を示す診断コード。\",\"definition\":\"未定義識別子、重複定義、unsafe rule などの名前解決違反を示すエラーコード。\",\"category\":\"diagnostics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"e-type\",\"label\":\"E-TYPE\",\"aliases\":[],\"short_tip\":\"型不一致を示す診断コード。\",\"definition\":\"関数引数/戻り値、relation 引数、条件式などの型整合性違反を示すエラーコード。\",\"category\":\"diagnostics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"e-total\",\"label\":\"E-TOTAL\",\"aliases\":[],\"short_tip\":\"停止性/全域性違反を示す診断コード。\",\"definition\":\"非 tail 再帰、非減少再帰、相互再帰など全域性条件違反を示すエラーコード。\",\"category\":\"diagnostics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\"]},{\"id\":\"e-match\",\"label\":\"E-MATCH\",\"aliases\":[],\"short_tip\":\"match 検査違反を示す診断コード。\",\"definition\":\"分岐非網羅、到達不能分岐、パターン型不一致を示すエラーコード。\",\"category\":\"diagnostics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\"]},{\"id\":\"e-prove\",\"label\":\"E-PROVE\",\"aliases\":[],\"short_tip\":\"証明失敗または universe 不備を示す診断コード。\",\"definition\":\"有限モデル検証での反例検出や必須 universe 欠落による失敗を示すエラーコード。\",\"category\":\"diagnostics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-spec.html\",\"/reference/troubleshooting.html\"]},{\"id\":\"l-dup-exact\",\"label\":\"L-DUP-EXACT\",\"aliases\":[],\"short_tip\":\"構文正規化後に確定した重複警告。\",\"definition\":\"正規化済みフォームが同一であることを根拠に重複と判定された lint コード。\",\"category\":\"diagnostics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\"]},{\"id\":\"l-dup-maybe\",\"label\":\"L-DUP-MAYBE\",\"aliases\":[],\"short_tip\":\"意味同値にもとづく重複候補警告。\",\"definition\":\"有限モデルでの双方向検証結果から、重複の可能性を示す lint コード。\",\"category\":\"diagnostics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/quickstart.html\"]},{\"id\":\"l-dup-skip-universe\",\"label\":\"L-DUP-SKIP-UNIVERSE\",\"aliases\":[],\"short_tip\":\"universe 不足で semantic-dup 判定を省略した警告。\",\"definition\":\"必要な universe が不足し、重複候補の意味検証を実施できなかったことを示す lint コード。\",\"category\":\"diagnostics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\",\"/tutorial/first-policy.html\"]},{\"id\":\"l-dup-skip-eval-depth\",\"label\":\"L-DUP-SKIP-EVAL-DEPTH\",\"aliases\":[],\"short_tip\":\"評価深さ上限到達で入力点を省略した警告。\",\"definition\":\"defn 比較時に再帰評価が深さ上限へ達し、判定対象の一部をスキップしたことを示す lint コード。\",\"category\":\"diagnostics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\",\"/reference/troubleshooting.html\"]},{\"id\":\"l-unused-decl\",\"label\":\"L-UNUSED-DECL\",\"aliases\":[],\"short_tip\":\"未参照宣言を示す警告コード。\",\"definition\":\"relation/sort/data などの宣言が参照されていないことを示す lint コード。\",\"category\":\"diagnostics\",\"match_mode\":\"token\",\"enabled_pages\":[\"/reference/language-guide.html\",\"/reference/language-spec.html\"]}]}");
+  const matcherSource = "{\"edge_offsets\":[0,14,17,18,19,19,22,23,24,24,26,27,28,29,30,31,32,32,34,35,36,36,37,38,38,39,40,41,42,43,43,44,45,46,47,48,49,50,50,51,52,52,53,54,55,56,56,57,58,59,60,60,61,62,63,64,64,65,65,66,67,68,68,69,69,70,71,72,73,74,74,75,76,77,78,79,80,81,82,83,84,85,86,86,87,88,89,90,91,92,93,94,95,96,97,98,98,99,100,101,102,103,104,105,106,107,108,108,109,114,116,117,118,119,119,120,121,122,123,124,125,126,127,128,129,129,130,131,132,133,134,135,135,137,138,139,139,140,141,142,142,143,144,145,146,146,147,148,149,149,150,152,153,154,155,158,159,160,161,162,162,163,164,165,166,166,167,168,169,170,172,173,174,175,176,177,178,179,179,180,181,182,183,184,185,186,187,188,188,189,190,191,192,193,194,195,196,197,198,198],\"edge_units\":[69,76,82,97,99,100,102,108,109,112,114,115,116,117,101,111,116,114,116,97,101,111,116,97,101,117,108,97,116,105,111,110,97,109,99,116,108,101,115,115,101,114,116,110,105,118,101,114,115,101,102,110,97,116,99,104,104,101,99,107,114,111,118,101,99,105,110,116,116,101,102,105,110,101,114,105,99,116,32,115,117,98,116,101,114,109,97,105,108,32,112,111,115,105,116,105,111,110,109,97,110,116,105,99,45,100,117,112,45,77,80,82,83,84,65,82,82,83,69,89,78,84,65,88,45,65,85,84,79,69,83,79,76,86,69,79,89,80,69,84,65,76,65,84,67,72,79,86,69,45,68,85,85,80,45,69,77,83,88,65,67,84,65,89,66,69,75,73,80,45,69,85,78,73,86,69,82,83,69,86,65,76,45,68,69,80,84,72,78,85,83,69,68,45,68,69,67,76],\"edge_targets\":[107,149,64,24,46,5,17,58,41,51,9,1,83,30,96,2,70,3,4,6,38,56,7,8,10,21,11,12,13,14,15,16,18,62,19,20,22,23,25,26,27,28,29,31,32,33,34,35,36,37,39,40,42,43,44,45,47,48,49,50,52,53,54,55,57,59,60,61,63,65,66,67,68,69,71,72,73,74,75,76,77,78,79,80,81,82,84,85,86,87,88,89,90,91,92,93,94,95,97,98,99,100,101,102,103,104,105,106,108,140,109,125,114,132,110,145,111,112,113,115,116,117,118,119,120,121,122,123,124,126,127,128,129,130,131,136,133,134,135,137,138,139,141,142,143,144,146,147,148,150,151,188,152,153,154,155,160,165,156,157,158,159,161,162,163,164,166,167,168,169,178,170,171,172,173,174,175,176,177,179,180,181,182,183,184,185,186,187,189,190,191,192,193,194,195,196,197,198],\"fail\":[0,0,0,9,83,0,24,83,84,0,0,58,24,83,0,0,0,0,24,46,83,30,58,0,0,1,1,96,9,83,0,0,0,0,0,9,1,96,0,17,0,0,24,83,46,47,0,0,0,46,0,0,9,0,0,0,0,46,0,0,0,83,41,83,0,0,17,0,0,0,83,9,0,46,83,0,1,30,0,83,0,9,41,0,24,0,58,0,51,0,1,0,83,0,0,0,0,41,42,0,83,0,46,0,5,30,51,0,0,0,0,64,0,107,0,0,0,0,0,0,0,0,0,0,0,64,107,0,0,149,0,107,0,0,0,107,0,0,0,149,0,0,0,0,0,64,0,0,107,0,0,0,0,0,0,107,0,0,0,0,0,0,0,0,107,0,0,0,0,0,0,0,0,0,107,64,0,107,107,0,0,149,150,151,107,0,0,0,0,0,0,0,107,0,0,0,107,0,149],\"output_offsets\":[0,0,0,0,0,1,1,1,1,2,2,2,2,2,2,2,2,3,3,3,3,4,4,4,5,5,5,5,5,5,6,6,6,6,6,6,6,6,7,7,7,8,8,8,8,8,9,9,9,9,9,10,10,10,10,10,11,11,12,12,12,12,13,13,14,14,14,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,21,21,21,21,22,22,22,22,23,23,23,23,23,24,24,24,24,25,25,25,25,25,25,25,25,25,25,25,26,26,26,26,26,27,27,27,27,27,27,27,27,27,27,27,27,27,28,28,28,28,28,28,28,28,28,28,29,29,29,29,29,29,29,29,29,29,29,30],\"output_variants\":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29],\"variant_terms\":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29],\"variant_lengths\":[4,4,8,4,4,6,8,4,5,5,5,3,4,3,6,14,13,12,7,13,9,6,7,7,7,11,11,19,21,13]}";
 
   const tokenCharPattern = /[A-Za-z0-9_-]/u;
 
@@ -471,58 +23,98 @@
     return (!prev || !isTokenChar(prev)) && (!next || !isTokenChar(next));
   }
 
-  function buildVariants(activePage) {
-    const variants = [];
-    for (const term of payload.terms) {
-      if (!Array.isArray(term.enabled_pages) || !term.enabled_pages.includes(activePage)) {
-        continue;
-      }
-      const rawVariants = [term.label, ...(term.aliases || [])].filter(Boolean);
-      const uniqueVariants = [...new Set(rawVariants)];
-      for (const value of uniqueVariants) {
-        variants.push({
-          id: term.id,
-          shortTip: term.short_tip,
-          value,
-          matchMode: term.match_mode
-        });
-      }
-    }
+  function loadMatcher() {
+    const matcher = JSON.parse(matcherSource);
+    return {
+      edgeOffsets: Int32Array.from(matcher.edge_offsets),
+      edgeUnits: Int32Array.from(matcher.edge_units),
+      edgeTargets: Int32Array.from(matcher.edge_targets),
+      failLinks: Int32Array.from(matcher.fail),
+      outputOffsets: Int32Array.from(matcher.output_offsets),
+      outputVariants: Int32Array.from(matcher.output_variants),
+      variantTerms: Int32Array.from(matcher.variant_terms),
+      variantLengths: Int32Array.from(matcher.variant_lengths)
+    };
+  }
 
-    variants.sort((left, right) => {
-      if (right.value.length !== left.value.length) {
-        return right.value.length - left.value.length;
+  function buildEnabledTerms(activePage) {
+    const enabled = new Uint8Array(payload.terms.length);
+    let count = 0;
+    payload.terms.forEach((term, index) => {
+      if (Array.isArray(term.enabled_pages) && term.enabled_pages.includes(activePage)) {
+        enabled[index] = 1;
+        count += 1;
       }
-      return left.value.localeCompare(right.value);
     });
+    return count > 0 ? enabled : null;
+  }
 
-    return variants;
+  function nextState(matcher, state, unit) {
+    let low = matcher.edgeOffsets[state];
+    let high = matcher.edgeOffsets[state + 1] - 1;
+    while (low <= high) {
+      const mid = (low + high) >> 1;
+      const candidate = matcher.edgeUnits[mid];
+      if (candidate === unit) {
+        return matcher.edgeTargets[mid];
+      }
+      if (candidate < unit) {
+        low = mid + 1;
+      } else {
+        high = mid - 1;
+      }
+    }
+    return -1;
   }
 
-  function findNextMatch(text, cursor, variants) {
-    let best = null;
-
-    for (const variant of variants) {
-      let index = text.indexOf(variant.value, cursor);
-      while (index !== -1) {
-        const end = index + variant.value.length;
-        const boundaryOk =
-          variant.matchMode !== "token" || hasTokenBoundary(text, index, end);
-        if (boundaryOk) {
-          if (
-            best === null ||
-            index < best.index ||
-            (index === best.index && variant.value.length > best.variant.value.length)
-          ) {
-            best = { index, end, variant };
-          }
-          break;
+  function findMatches(text, enabledTerms, matcher) {
+    const candidates = [];
+    let state = 0;
+
+    for (let position = 0; position < text.length; position += 1) {
+      const unit = text.charCodeAt(position);
+      let next = nextState(matcher, state, unit);
+      while (next === -1 && state !== 0) {
+        state = matcher.failLinks[state];
+        next = nextState(matcher, state, unit);
+      }
+      state = next === -1 ? 0 : next;
+
+      for (let cursor = matcher.outputOffsets[state]; cursor < matcher.outputOffsets[state + 1]; cursor += 1) {
+        const variant = matcher.outputVariants[cursor];
+        const termIndex = matcher.variantTerms[variant];
+        if (!enabledTerms[termIndex]) {
+          continue;
         }
-        index = text.indexOf(variant.value, index + 1);
+        const end = position + 1;
+        const index = end - matcher.variantLengths[variant];
+        const term = payload.terms[termIndex];
+        if (term.match_mode === "token" && !hasTokenBoundary(text, index, end)) {
+          continue;
+        }
+        candidates.push({ index, end, termIndex });
       }
     }
 
-    return best;
+    candidates.sort((left, right) => {
+      if (left.index !== right.index) {
+        return left.index - right.index;
+      }
+      if (left.end !== right.end) {
+        return right.end - left.end;
+      }
+      return left.termIndex - right.termIndex;
+    });
+
+    const matches = [];
+    let cursor = 0;
+    for (const candidate of candidates) {
+      if (candidate.index >= cursor) {
+        matches.push(candidate);
+        cursor = candidate.end;
+      }
+    }
+    return matches;
   }
 
   function resolvePathToRoot() {
@@ -540,36 +132,36 @@
     return `${root}reference/glossary.html#term-${termId}`;
   }
 
-  function replaceTextNode(textNode, variants) {
+  function replaceTextNode(textNode, enabledTerms, matcher) {
     const text = textNode.nodeValue ?? "";
     if (text.trim().length === 0) {
       return;
     }
 
-    let cursor = 0;
-    let match = findNextMatch(text, cursor, variants);
-    if (match === null) {
+    const matches = findMatches(text, enabledTerms, matcher);
+    if (matches.length === 0) {
       return;
     }
 
     const fragment = document.createDocumentFragment();
-    while (match !== null) {
+    let cursor = 0;
+    for (const match of matches) {
       if (match.index > cursor) {
         fragment.appendChild(document.createTextNode(text.slice(cursor, match.index)));
       }
 
+      const term = payload.terms[match.termIndex];
       const value = text.slice(match.index, match.end);
       const anchor = document.createElement("a");
       anchor.className = "dtl-term";
-      anchor.href = buildGlossaryHref(match.variant.id);
-      anchor.setAttribute("data-term-id", match.variant.id);
-      anchor.setAttribute("data-tip", match.variant.shortTip);
-      anchor.setAttribute("title", match.variant.shortTip);
+      anchor.href = buildGlossaryHref(term.id);
+      anchor.setAttribute("data-term-id", term.id);
+      anchor.setAttribute("data-tip", term.short_tip);
+      anchor.setAttribute("title", term.short_tip);
       anchor.textContent = value;
       fragment.appendChild(anchor);
 
       cursor = match.end;
-      match = findNextMatch(text, cursor, variants);
     }
 
     if (cursor < text.length) {
@@ -606,8 +198,8 @@
       return;
     }
 
-    const variants = buildVariants(activePage);
-    if (variants.length === 0) {
+    const enabledTerms = buildEnabledTerms(activePage);
+    if (enabledTerms === null) {
       return;
     }
 
@@ -616,6 +208,9 @@
       return;
     }
 
+    // 対象ページでだけオートマトンを復元し、他のページでは matcher の JSON.parse と型付き配列化を行わない。
+    const matcher = loadMatcher();
+
     const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT);
     const textNodes = [];
     while (walker.nextNode()) {
@@ -626,7 +221,7 @@
     }
 
     for (const node of textNodes) {
-      replaceTextNode(node, variants);
+      replaceTextNode(node, enabledTerms, matcher);
     }
   }
 
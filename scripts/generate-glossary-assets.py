@@ -2,31 +2,46 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import hashlib
+import io
 import json
+import os
 import re
 import sys
-from collections import defaultdict
+import tempfile
+from collections import deque
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, List
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 TERMS_FILE = REPO_ROOT / "docs-site" / "src" / "reference" / "glossary-terms.json"
 GLOSSARY_MD = REPO_ROOT / "docs-site" / "src" / "reference" / "glossary.md"
 TERMS_JS = REPO_ROOT / "docs-site" / "theme" / "dtl-terms.js"
 
-REQUIRED_TERM_FIELDS = {
-    "id",
-    "label",
-    "aliases",
-    "short_tip",
-    "definition",
-    "category",
-    "match_mode",
-    "enabled_pages",
-}
+COMPARE_CHUNK_SIZE = 64 * 1024
+
+CACHE_DIR_NAME = "dtl-glossary"
+CACHE_ENTRY_PATTERN = re.compile(r"^[0-9a-f]{16}\.(?:md|js)$")
+
+REQUIRED_TERM_FIELDS = frozenset(
+    {
+        "id",
+        "label",
+        "aliases",
+        "short_tip",
+        "definition",
+        "category",
+        "match_mode",
+        "enabled_pages",
+    }
+)
 
 ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]*$")
-SUPPORTED_MATCH_MODES = {"token", "exact"}
+SUPPORTED_MATCH_MODES = frozenset({"token", "exact"})
+
+TERMS_SCRIPT_FIELDS = ("target_pages", "terms")
 
 CATEGORY_TITLES = {
     "dsl-keyword": "DSL キーワード",
@@ -44,14 +59,95 @@ CATEGORY_ORDER = [
     "diagnostics",
 ]
 
+CATEGORY_ORDER_INDEX = {category: index for index, category in enumerate(CATEGORY_ORDER)}
+
+
+# dataclass(slots=True) は Python 3.10 以降にしかないため、__slots__ を手で宣言する。
+# frozen=True は __init__ が全フィールドを object.__setattr__ 経由で設定して遅くなるので付けない。
+# 生成後の Term は変更しない前提で扱う。
+@dataclasses.dataclass
+class Term:
+    __slots__ = (
+        "id",
+        "label",
+        "aliases",
+        "short_tip",
+        "definition",
+        "category",
+        "match_mode",
+        "enabled_pages",
+    )
+
+    id: str
+    label: str
+    aliases: list[str]
+    short_tip: str
+    definition: str
+    category: str
+    match_mode: str
+    enabled_pages: list[str]
+
+    @classmethod
+    def from_json(cls, raw: dict[str, Any]) -> Term:
+        # 検証済みの値を詰め替えるだけなので、配列はコピーせず位置引数で渡す。
+        return cls(
+            raw["id"],
+            raw["label"],
+            raw["aliases"],
+            raw["short_tip"],
+            raw["definition"],
+            raw["category"],
+            raw["match_mode"],
+            raw["enabled_pages"],
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+
+
+# category -> ラベル順（casefold、同名は出現順）に整列した term のリスト
+SortedGroups = Dict[str, List[Term]]
+
+GLOSSARY_HEADER = (
+    "# 用語集\n"
+    "\n"
+    "<!-- このファイルは scripts/generate-glossary-assets.py と docs-site/src/reference/glossary-terms.json から自動生成されます。 -->\n"
+    "\n"
+    "専門語の短義と定義を、本文中のツールチップと同一ソースで管理しています。\n"
+    "\n"
+    "## 対象ページ\n"
+    "\n"
+)
+
+GLOSSARY_MATCH_MODES = (
+    "\n"
+    "## 一致方式\n"
+    "\n"
+    "- `token`: トークン境界で一致（前後が英数字/`_`/`-` でない場合のみ）\n"
+    "- `exact`: 完全一致\n"
+    "\n"
+)
+
+SHORT_TIP_PREFIX = "- 短義: "
+DEFINITION_PREFIX = "- 定義: "
+ALIASES_PREFIX = "- 別名: "
+PAGES_PREFIX = "- 適用ページ: "
+MATCH_MODE_PREFIX = "- 一致方式: "
+
+
+def read_terms_file(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError as exc:
+        raise ValueError(f"用語台帳が見つかりません: {path}") from exc
 
-def load_terms_file(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        raise ValueError(f"用語台帳が見つかりません: {path}")
 
+def load_terms_bytes(source: bytes, path: Path) -> dict[str, Any]:
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        # json.loads(bytes) は BOM 付きや UTF-16/32 も自動判別して受理してしまうため、
+        # 用語台帳は UTF-8 に限定して明示的に decode する。
+        raw = json.loads(source.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise ValueError(f"JSON の構文が不正です: {path}: {exc}") from exc
 
     if not isinstance(raw, dict):
@@ -68,332 +164,590 @@ def load_terms_file(path: Path) -> dict[str, Any]:
     for page in target_pages:
         if not isinstance(page, str) or not page.startswith("/"):
             raise ValueError(f"target_pages の値が不正です: {page!r}")
+    target_pages_set = frozenset(target_pages)
 
     terms = raw["terms"]
     if not isinstance(terms, list) or not terms:
         raise ValueError("terms は 1 件以上の配列である必要があります")
 
-    seen_ids: set[str] = set()
-    for index, term in enumerate(terms):
-        if not isinstance(term, dict):
-            raise ValueError(f"terms[{index}] は object である必要があります")
+    raw["terms"], raw["_sorted_groups"] = validate_terms(terms, target_pages_set)
+    return raw
 
-        missing = REQUIRED_TERM_FIELDS - term.keys()
-        if missing:
-            missing_text = ", ".join(sorted(missing))
-            raise ValueError(f"terms[{index}] に必須フィールドがありません: {missing_text}")
 
-        unknown = set(term.keys()) - REQUIRED_TERM_FIELDS
-        if unknown:
-            unknown_text = ", ".join(sorted(unknown))
-            raise ValueError(f"terms[{index}] に未知フィールドがあります: {unknown_text}")
+def validate_terms(
+    terms: list[Any], target_pages_set: frozenset[str]
+) -> tuple[list[Term], SortedGroups]:
+    # 検証と同じ走査でカテゴリ別に振り分け、最後にカテゴリごとに 1 回だけ整列する。
+    # 安定ソートなので同名ラベルは出現順を保つ。
+    validated: list[Term] = []
+    sorted_groups: SortedGroups = {}
+    seen_ids: set[str] = set()
+    for index, term in enumerate(terms):
+        validate_term_schema(index, term)
 
         term_id = term["id"]
-        if not isinstance(term_id, str) or not ID_PATTERN.match(term_id):
-            raise ValueError(f"terms[{index}].id が不正です: {term_id!r}")
-
         if term_id in seen_ids:
             raise ValueError(f"terms[{index}].id が重複しています: {term_id}")
         seen_ids.add(term_id)
 
-        for text_field in ("label", "short_tip", "definition", "category", "match_mode"):
-            value = term[text_field]
-            if not isinstance(value, str) or not value.strip():
-                raise ValueError(f"terms[{index}].{text_field} は非空文字列である必要があります")
-
-        aliases = term["aliases"]
-        if not isinstance(aliases, list):
-            raise ValueError(f"terms[{index}].aliases は配列である必要があります")
-        for alias in aliases:
-            if not isinstance(alias, str) or not alias.strip():
-                raise ValueError(f"terms[{index}].aliases に不正値があります: {alias!r}")
-
-        match_mode = term["match_mode"]
-        if match_mode not in SUPPORTED_MATCH_MODES:
-            raise ValueError(
-                f"terms[{index}].match_mode は {sorted(SUPPORTED_MATCH_MODES)} のいずれかである必要があります"
-            )
-
-        enabled_pages = term["enabled_pages"]
-        if not isinstance(enabled_pages, list) or not enabled_pages:
-            raise ValueError(f"terms[{index}].enabled_pages は 1 件以上の配列である必要があります")
-
-        for page in enabled_pages:
-            if page not in target_pages:
+        for page in term["enabled_pages"]:
+            # 非文字列は unhashable な場合があるため、集合引きの前に弾く。
+            if not isinstance(page, str) or page not in target_pages_set:
                 raise ValueError(
                     f"terms[{index}].enabled_pages に target_pages 外の値があります: {page!r}"
                 )
 
-    return raw
+        validated_term = Term.from_json(term)
+        validated.append(validated_term)
+        sorted_groups.setdefault(validated_term.category, []).append(validated_term)
+
+    for group in sorted_groups.values():
+        group.sort(key=term_sort_key)
+
+    return validated, sorted_groups
+
+
+def term_sort_key(term: Term) -> str:
+    return term.label.casefold()
+
+
+def is_nonempty_str(value: object) -> bool:
+    # strip() は判定のためだけに新しい文字列を作るので、isspace() で空白のみかを見る。
+    return type(value) is str and bool(value) and not value.isspace()
+
+
+def validate_term_schema(index: int, term: Any) -> None:
+    if not isinstance(term, dict):
+        raise ValueError(f"terms[{index}] は object である必要があります")
+
+    if REQUIRED_TERM_FIELDS ^ term.keys():
+        missing = REQUIRED_TERM_FIELDS - term.keys()
+        if missing:
+            missing_text = ", ".join(sorted(missing))
+            raise ValueError(f"terms[{index}] に必須フィールドがありません: {missing_text}")
+
+        unknown = term.keys() - REQUIRED_TERM_FIELDS
+        unknown_text = ", ".join(sorted(unknown))
+        raise ValueError(f"terms[{index}] に未知フィールドがあります: {unknown_text}")
+
+    term_id = term["id"]
+    if not isinstance(term_id, str) or not ID_PATTERN.match(term_id):
+        raise ValueError(f"terms[{index}].id が不正です: {term_id!r}")
+
+    for text_field in ("label", "short_tip", "definition", "category", "match_mode"):
+        value = term[text_field]
+        if not is_nonempty_str(value):
+            raise ValueError(f"terms[{index}].{text_field} は非空文字列である必要があります")
+
+    aliases = term["aliases"]
+    if not isinstance(aliases, list):
+        raise ValueError(f"terms[{index}].aliases は配列である必要があります")
+    for alias in aliases:
+        if not is_nonempty_str(alias):
+            raise ValueError(f"terms[{index}].aliases に不正値があります: {alias!r}")
+
+    match_mode = term["match_mode"]
+    if match_mode not in SUPPORTED_MATCH_MODES:
+        raise ValueError(
+            f"terms[{index}].match_mode は {sorted(SUPPORTED_MATCH_MODES)} のいずれかである必要があります"
+        )
+
+    enabled_pages = term["enabled_pages"]
+    if not isinstance(enabled_pages, list) or not enabled_pages:
+        raise ValueError(f"terms[{index}].enabled_pages は 1 件以上の配列である必要があります")
 
 
 def category_sort_key(category: str) -> tuple[int, str]:
-    if category in CATEGORY_ORDER:
-        return (CATEGORY_ORDER.index(category), category)
-    return (len(CATEGORY_ORDER), category)
+    return (CATEGORY_ORDER_INDEX.get(category, len(CATEGORY_ORDER)), category)
+
+
+def render_term_markdown(term: Term) -> str:
+    aliases = term.aliases
+    if aliases:
+        alias_text = ", ".join(f"`{alias}`" for alias in aliases)
+    else:
+        alias_text = "なし"
+    pages_text = ", ".join(f"`{page}`" for page in term.enabled_pages)
+
+    return (
+        f'<a id="term-{term.id}"></a>\n'
+        f"### `{term.label}`\n"
+        "\n"
+        f"{SHORT_TIP_PREFIX}{term.short_tip}\n"
+        f"{DEFINITION_PREFIX}{term.definition}\n"
+        f"{ALIASES_PREFIX}{alias_text}\n"
+        f"{PAGES_PREFIX}{pages_text}\n"
+        f"{MATCH_MODE_PREFIX}`{term.match_mode}`\n"
+        "\n"
+    )
 
 
 def render_glossary_markdown(payload: dict[str, Any]) -> str:
-    terms: list[dict[str, Any]] = payload["terms"]
-    grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    for term in terms:
-        grouped[term["category"]].append(term)
-
-    lines: list[str] = [
-        "# 用語集",
-        "",
-        "<!-- このファイルは scripts/generate-glossary-assets.py と docs-site/src/reference/glossary-terms.json から自動生成されます。 -->",
-        "",
-        "専門語の短義と定義を、本文中のツールチップと同一ソースで管理しています。",
-        "",
-        "## 対象ページ",
-        "",
-    ]
+    sorted_groups: SortedGroups = payload["_sorted_groups"]
+
+    buf = io.StringIO()
+    buf.write(GLOSSARY_HEADER)
 
     for page in payload["target_pages"]:
-        lines.append(f"- `{page}`")
+        buf.write(f"- `{page}`\n")
 
-    lines.extend(["", "## 一致方式", "", "- `token`: トークン境界で一致（前後が英数字/`_`/`-` でない場合のみ）", "- `exact`: 完全一致", ""])
+    buf.write(GLOSSARY_MATCH_MODES)
 
-    for category in sorted(grouped.keys(), key=category_sort_key):
+    for category in sorted(sorted_groups, key=category_sort_key):
         title = CATEGORY_TITLES.get(category, category)
-        lines.append(f"## {title}")
-        lines.append("")
+        buf.write(f"## {title}\n\n")
 
-        category_terms = sorted(grouped[category], key=lambda item: item["label"].lower())
-        for term in category_terms:
-            lines.append(f'<a id="term-{term["id"]}"></a>')
-            lines.append(f'### `{term["label"]}`')
-            lines.append("")
-            lines.append(f'- 短義: {term["short_tip"]}')
-            lines.append(f'- 定義: {term["definition"]}')
+        for term in sorted_groups[category]:
+            buf.write(render_term_markdown(term))
 
-            aliases = term["aliases"]
-            if aliases:
-                alias_text = ", ".join(f"`{alias}`" for alias in aliases)
-            else:
-                alias_text = "なし"
-            lines.append(f"- 別名: {alias_text}")
+    return buf.getvalue().rstrip() + "\n"
 
-            pages_text = ", ".join(f"`{page}`" for page in term["enabled_pages"])
-            lines.append(f"- 適用ページ: {pages_text}")
-            lines.append(f'- 一致方式: `{term["match_mode"]}`')
-            lines.append("")
 
-    return "\n".join(lines).rstrip() + "\n"
+TERMS_SCRIPT_PAYLOAD_SLOT = "__PAYLOAD__"
+TERMS_SCRIPT_MATCHER_SLOT = "__MATCHER__"
 
+# JS 側の {} と衝突しないよう、format ではなく str.replace で payload / matcher を差し込む。
+TERMS_SCRIPT_TEMPLATE = """\
+(() => {
+  const payload = JSON.parse(__PAYLOAD__);
+  const matcherSource = __MATCHER__;
 
-def render_terms_script(payload: dict[str, Any]) -> str:
-    payload_json = json.dumps(
-        {
-            "target_pages": payload["target_pages"],
-            "terms": payload["terms"],
-        },
+  const tokenCharPattern = /[A-Za-z0-9_-]/u;
+
+  function resolveActivePage(pathname) {
+    for (const page of payload.target_pages) {
+      if (pathname.endsWith(page)) {
+        return page;
+      }
+    }
+    return null;
+  }
+
+  function isTokenChar(char) {
+    return char.length > 0 && tokenCharPattern.test(char);
+  }
+
+  function hasTokenBoundary(text, start, end) {
+    const prev = start > 0 ? text[start - 1] : "";
+    const next = end < text.length ? text[end] : "";
+    return (!prev || !isTokenChar(prev)) && (!next || !isTokenChar(next));
+  }
+
+  function loadMatcher() {
+    const matcher = JSON.parse(matcherSource);
+    return {
+      edgeOffsets: Int32Array.from(matcher.edge_offsets),
+      edgeUnits: Int32Array.from(matcher.edge_units),
+      edgeTargets: Int32Array.from(matcher.edge_targets),
+      failLinks: Int32Array.from(matcher.fail),
+      outputOffsets: Int32Array.from(matcher.output_offsets),
+      outputVariants: Int32Array.from(matcher.output_variants),
+      variantTerms: Int32Array.from(matcher.variant_terms),
+      variantLengths: Int32Array.from(matcher.variant_lengths)
+    };
+  }
+
+  function buildEnabledTerms(activePage) {
+    const enabled = new Uint8Array(payload.terms.length);
+    let count = 0;
+    payload.terms.forEach((term, index) => {
+      if (Array.isArray(term.enabled_pages) && term.enabled_pages.includes(activePage)) {
+        enabled[index] = 1;
+        count += 1;
+      }
+    });
+    return count > 0 ? enabled : null;
+  }
+
+  function nextState(matcher, state, unit) {
+    let low = matcher.edgeOffsets[state];
+    let high = matcher.edgeOffsets[state + 1] - 1;
+    while (low <= high) {
+      const mid = (low + high) >> 1;
+      const candidate = matcher.edgeUnits[mid];
+      if (candidate === unit) {
+        return matcher.edgeTargets[mid];
+      }
+      if (candidate < unit) {
+        low = mid + 1;
+      } else {
+        high = mid - 1;
+      }
+    }
+    return -1;
+  }
+
+  function findMatches(text, enabledTerms, matcher) {
+    const candidates = [];
+    let state = 0;
+
+    for (let position = 0; position < text.length; position += 1) {
+      const unit = text.charCodeAt(position);
+      let next = nextState(matcher, state, unit);
+      while (next === -1 && state !== 0) {
+        state = matcher.failLinks[state];
+        next = nextState(matcher, state, unit);
+      }
+      state = next === -1 ? 0 : next;
+
+      for (let cursor = matcher.outputOffsets[state]; cursor < matcher.outputOffsets[state + 1]; cursor += 1) {
+        const variant = matcher.outputVariants[cursor];
+        const termIndex = matcher.variantTerms[variant];
+        if (!enabledTerms[termIndex]) {
+          continue;
+        }
+        const end = position + 1;
+        const index = end - matcher.variantLengths[variant];
+        const term = payload.terms[termIndex];
+        if (term.match_mode === "token" && !hasTokenBoundary(text, index, end)) {
+          continue;
+        }
+        candidates.push({ index, end, termIndex });
+      }
+    }
+
+    candidates.sort((left, right) => {
+      if (left.index !== right.index) {
+        return left.index - right.index;
+      }
+      if (left.end !== right.end) {
+        return right.end - left.end;
+      }
+      return left.termIndex - right.termIndex;
+    });
+
+    const matches = [];
+    let cursor = 0;
+    for (const candidate of candidates) {
+      if (candidate.index >= cursor) {
+        matches.push(candidate);
+        cursor = candidate.end;
+      }
+    }
+    return matches;
+  }
+
+  function resolvePathToRoot() {
+    if (typeof path_to_root === "string") {
+      return path_to_root;
+    }
+    if (typeof window.path_to_root === "string") {
+      return window.path_to_root;
+    }
+    return "";
+  }
+
+  function buildGlossaryHref(termId) {
+    const root = resolvePathToRoot();
+    return `${root}reference/glossary.html#term-${termId}`;
+  }
+
+  function replaceTextNode(textNode, enabledTerms, matcher) {
+    const text = textNode.nodeValue ?? "";
+    if (text.trim().length === 0) {
+      return;
+    }
+
+    const matches = findMatches(text, enabledTerms, matcher);
+    if (matches.length === 0) {
+      return;
+    }
+
+    const fragment = document.createDocumentFragment();
+    let cursor = 0;
+    for (const match of matches) {
+      if (match.index > cursor) {
+        fragment.appendChild(document.createTextNode(text.slice(cursor, match.index)));
+      }
+
+      const term = payload.terms[match.termIndex];
+      const value = text.slice(match.index, match.end);
+      const anchor = document.createElement("a");
+      anchor.className = "dtl-term";
+      anchor.href = buildGlossaryHref(term.id);
+      anchor.setAttribute("data-term-id", term.id);
+      anchor.setAttribute("data-tip", term.short_tip);
+      anchor.setAttribute("title", term.short_tip);
+      anchor.textContent = value;
+      fragment.appendChild(anchor);
+
+      cursor = match.end;
+    }
+
+    if (cursor < text.length) {
+      fragment.appendChild(document.createTextNode(text.slice(cursor)));
+    }
+
+    const parent = textNode.parentNode;
+    if (parent) {
+      parent.replaceChild(fragment, textNode);
+    }
+  }
+
+  function isEligibleTextNode(node, root) {
+    const parent = node.parentElement;
+    if (!parent || !root.contains(parent)) {
+      return false;
+    }
+
+    if (!parent.closest("p, li, td, code")) {
+      return false;
+    }
+
+    if (parent.closest("a, pre, h1, h2, h3, h4, h5, h6, script, style, .dtl-term")) {
+      return false;
+    }
+
+    return true;
+  }
+
+  function annotateTerms() {
+    const pathname = typeof window.location?.pathname === "string" ? window.location.pathname : "";
+    const activePage = resolveActivePage(pathname);
+    if (!activePage) {
+      return;
+    }
+
+    const enabledTerms = buildEnabledTerms(activePage);
+    if (enabledTerms === null) {
+      return;
+    }
+
+    const root = document.querySelector("#mdbook-content main");
+    if (!root) {
+      return;
+    }
+
+    // 対象ページでだけオートマトンを復元し、他のページでは matcher の JSON.parse と型付き配列化を行わない。
+    const matcher = loadMatcher();
+
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT);
+    const textNodes = [];
+    while (walker.nextNode()) {
+      const current = walker.currentNode;
+      if (isEligibleTextNode(current, root)) {
+        textNodes.push(current);
+      }
+    }
+
+    for (const node of textNodes) {
+      replaceTextNode(node, enabledTerms, matcher);
+    }
+  }
+
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", annotateTerms);
+  } else {
+    annotateTerms();
+  }
+})();
+"""
+
+
+def render_terms_payload(payload: dict[str, Any]) -> str:
+    # JSON 由来の payload は循環しないため、循環検出の id 追跡を省く。
+    return json.dumps(
+        {field: payload[field] for field in TERMS_SCRIPT_FIELDS},
         ensure_ascii=False,
-        indent=2,
+        separators=(",", ":"),
+        check_circular=False,
+        default=Term.to_json,
     )
 
-    return (
-        "(() => {\n"
-        "  const payload = "
-        + payload_json
-        + ";\n\n"
-        "  const tokenCharPattern = /[A-Za-z0-9_-]/u;\n\n"
-        "  function resolveActivePage(pathname) {\n"
-        "    for (const page of payload.target_pages) {\n"
-        "      if (pathname.endsWith(page)) {\n"
-        "        return page;\n"
-        "      }\n"
-        "    }\n"
-        "    return null;\n"
-        "  }\n\n"
-        "  function isTokenChar(char) {\n"
-        "    return char.length > 0 && tokenCharPattern.test(char);\n"
-        "  }\n\n"
-        "  function hasTokenBoundary(text, start, end) {\n"
-        "    const prev = start > 0 ? text[start - 1] : \"\";\n"
-        "    const next = end < text.length ? text[end] : \"\";\n"
-        "    return (!prev || !isTokenChar(prev)) && (!next || !isTokenChar(next));\n"
-        "  }\n\n"
-        "  function buildVariants(activePage) {\n"
-        "    const variants = [];\n"
-        "    for (const term of payload.terms) {\n"
-        "      if (!Array.isArray(term.enabled_pages) || !term.enabled_pages.includes(activePage)) {\n"
-        "        continue;\n"
-        "      }\n"
-        "      const rawVariants = [term.label, ...(term.aliases || [])].filter(Boolean);\n"
-        "      const uniqueVariants = [...new Set(rawVariants)];\n"
-        "      for (const value of uniqueVariants) {\n"
-        "        variants.push({\n"
-        "          id: term.id,\n"
-        "          shortTip: term.short_tip,\n"
-        "          value,\n"
-        "          matchMode: term.match_mode\n"
-        "        });\n"
-        "      }\n"
-        "    }\n"
-        "\n"
-        "    variants.sort((left, right) => {\n"
-        "      if (right.value.length !== left.value.length) {\n"
-        "        return right.value.length - left.value.length;\n"
-        "      }\n"
-        "      return left.value.localeCompare(right.value);\n"
-        "    });\n"
-        "\n"
-        "    return variants;\n"
-        "  }\n\n"
-        "  function findNextMatch(text, cursor, variants) {\n"
-        "    let best = null;\n"
-        "\n"
-        "    for (const variant of variants) {\n"
-        "      let index = text.indexOf(variant.value, cursor);\n"
-        "      while (index !== -1) {\n"
-        "        const end = index + variant.value.length;\n"
-        "        const boundaryOk =\n"
-        "          variant.matchMode !== \"token\" || hasTokenBoundary(text, index, end);\n"
-        "        if (boundaryOk) {\n"
-        "          if (\n"
-        "            best === null ||\n"
-        "            index < best.index ||\n"
-        "            (index === best.index && variant.value.length > best.variant.value.length)\n"
-        "          ) {\n"
-        "            best = { index, end, variant };\n"
-        "          }\n"
-        "          break;\n"
-        "        }\n"
-        "        index = text.indexOf(variant.value, index + 1);\n"
-        "      }\n"
-        "    }\n"
-        "\n"
-        "    return best;\n"
-        "  }\n\n"
-        "  function resolvePathToRoot() {\n"
-        "    if (typeof path_to_root === \"string\") {\n"
-        "      return path_to_root;\n"
-        "    }\n"
-        "    if (typeof window.path_to_root === \"string\") {\n"
-        "      return window.path_to_root;\n"
-        "    }\n"
-        "    return \"\";\n"
-        "  }\n\n"
-        "  function buildGlossaryHref(termId) {\n"
-        "    const root = resolvePathToRoot();\n"
-        "    return `${root}reference/glossary.html#term-${termId}`;\n"
-        "  }\n\n"
-        "  function replaceTextNode(textNode, variants) {\n"
-        "    const text = textNode.nodeValue ?? \"\";\n"
-        "    if (text.trim().length === 0) {\n"
-        "      return;\n"
-        "    }\n"
-        "\n"
-        "    let cursor = 0;\n"
-        "    let match = findNextMatch(text, cursor, variants);\n"
-        "    if (match === null) {\n"
-        "      return;\n"
-        "    }\n"
-        "\n"
-        "    const fragment = document.createDocumentFragment();\n"
-        "    while (match !== null) {\n"
-        "      if (match.index > cursor) {\n"
-        "        fragment.appendChild(document.createTextNode(text.slice(cursor, match.index)));\n"
-        "      }\n"
-        "\n"
-        "      const value = text.slice(match.index, match.end);\n"
-        "      const anchor = document.createElement(\"a\");\n"
-        "      anchor.className = \"dtl-term\";\n"
-        "      anchor.href = buildGlossaryHref(match.variant.id);\n"
-        "      anchor.setAttribute(\"data-term-id\", match.variant.id);\n"
-        "      anchor.setAttribute(\"data-tip\", match.variant.shortTip);\n"
-        "      anchor.setAttribute(\"title\", match.variant.shortTip);\n"
-        "      anchor.textContent = value;\n"
-        "      fragment.appendChild(anchor);\n"
-        "\n"
-        "      cursor = match.end;\n"
-        "      match = findNextMatch(text, cursor, variants);\n"
-        "    }\n"
-        "\n"
-        "    if (cursor < text.length) {\n"
-        "      fragment.appendChild(document.createTextNode(text.slice(cursor)));\n"
-        "    }\n"
-        "\n"
-        "    const parent = textNode.parentNode;\n"
-        "    if (parent) {\n"
-        "      parent.replaceChild(fragment, textNode);\n"
-        "    }\n"
-        "  }\n\n"
-        "  function isEligibleTextNode(node, root) {\n"
-        "    const parent = node.parentElement;\n"
-        "    if (!parent || !root.contains(parent)) {\n"
-        "      return false;\n"
-        "    }\n"
-        "\n"
-        "    if (!parent.closest(\"p, li, td, code\")) {\n"
-        "      return false;\n"
-        "    }\n"
-        "\n"
-        "    if (parent.closest(\"a, pre, h1, h2, h3, h4, h5, h6, script, style, .dtl-term\")) {\n"
-        "      return false;\n"
-        "    }\n"
-        "\n"
-        "    return true;\n"
-        "  }\n\n"
-        "  function annotateTerms() {\n"
-        "    const pathname = typeof window.location?.pathname === \"string\" ? window.location.pathname : \"\";\n"
-        "    const activePage = resolveActivePage(pathname);\n"
-        "    if (!activePage) {\n"
-        "      return;\n"
-        "    }\n"
-        "\n"
-        "    const variants = buildVariants(activePage);\n"
-        "    if (variants.length === 0) {\n"
-        "      return;\n"
-        "    }\n"
-        "\n"
-        "    const root = document.querySelector(\"#mdbook-content main\");\n"
-        "    if (!root) {\n"
-        "      return;\n"
-        "    }\n"
-        "\n"
-        "    const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT);\n"
-        "    const textNodes = [];\n"
-        "    while (walker.nextNode()) {\n"
-        "      const current = walker.currentNode;\n"
-        "      if (isEligibleTextNode(current, root)) {\n"
-        "        textNodes.push(current);\n"
-        "      }\n"
-        "    }\n"
-        "\n"
-        "    for (const node of textNodes) {\n"
-        "      replaceTextNode(node, variants);\n"
-        "    }\n"
-        "  }\n\n"
-        "  if (document.readyState === \"loading\") {\n"
-        "    document.addEventListener(\"DOMContentLoaded\", annotateTerms);\n"
-        "  } else {\n"
-        "    annotateTerms();\n"
-        "  }\n"
-        "})();\n"
-    )
 
+def render_json_literal(body: str) -> str:
+    # JSON 文字列は JS の文字列リテラルとしても妥当なので、そのまま JSON.parse に渡せる。
+    # 大きなデータはオブジェクトリテラルより JSON.parse の方が構文解析が速い。
+    return json.dumps(body, ensure_ascii=False)
+
+
+def utf16_code_units(value: str) -> list[int]:
+    # JS の文字列添字は UTF-16 コード単位なので、オートマトンもその単位で組む。
+    encoded = value.encode("utf-16-le")
+    return [int.from_bytes(encoded[offset : offset + 2], "little") for offset in range(0, len(encoded), 2)]
+
+
+def build_term_matcher(terms: list[Term]) -> dict[str, list[int]]:
+    # label と aliases 全体の Aho–Corasick オートマトン。ページ別の有効判定と
+    # token 境界の判定は出力時に JS 側で行う。
+    goto: list[dict[int, int]] = [{}]
+    outputs: list[list[int]] = [[]]
+    variant_terms: list[int] = []
+    variant_lengths: list[int] = []
+
+    for term_index, term in enumerate(terms):
+        for value in dict.fromkeys([term.label, *term.aliases]):
+            units = utf16_code_units(value)
+            state = 0
+            for unit in units:
+                next_state = goto[state].get(unit)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][unit] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(len(variant_terms))
+            variant_terms.append(term_index)
+            variant_lengths.append(len(units))
+
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for unit, next_state in goto[state].items():
+            fallback = fail[state]
+            while fallback and unit not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[next_state] = goto[fallback].get(unit, 0)
+            outputs[next_state].extend(outputs[fail[next_state]])
+            queue.append(next_state)
+
+    edge_offsets = [0]
+    edge_units: list[int] = []
+    edge_targets: list[int] = []
+    output_offsets = [0]
+    output_variants: list[int] = []
+    for edges, state_outputs in zip(goto, outputs):
+        for unit in sorted(edges):
+            edge_units.append(unit)
+            edge_targets.append(edges[unit])
+        edge_offsets.append(len(edge_units))
+        output_variants.extend(state_outputs)
+        output_offsets.append(len(output_variants))
+
+    return {
+        "edge_offsets": edge_offsets,
+        "edge_units": edge_units,
+        "edge_targets": edge_targets,
+        "fail": fail,
+        "output_offsets": output_offsets,
+        "output_variants": output_variants,
+        "variant_terms": variant_terms,
+        "variant_lengths": variant_lengths,
+    }
+
+
+def render_terms_script(payload: dict[str, Any]) -> str:
+    matcher_json = json.dumps(build_term_matcher(payload["terms"]), separators=(",", ":"))
+    # payload 側の文字列に slot 名が含まれても壊れないよう、matcher を先に差し込む。
+    script = TERMS_SCRIPT_TEMPLATE.replace(TERMS_SCRIPT_MATCHER_SLOT, render_json_literal(matcher_json), 1)
+    return script.replace(TERMS_SCRIPT_PAYLOAD_SLOT, render_json_literal(render_terms_payload(payload)), 1)
 
-def diff_outputs(outputs: dict[Path, str]) -> list[Path]:
+
+def matches_file(path: Path, expected: bytes) -> bool:
+    try:
+        if path.stat().st_size != len(expected):
+            return False
+        with path.open("rb") as handle:
+            view = memoryview(expected)
+            offset = 0
+            while chunk := handle.read(COMPARE_CHUNK_SIZE):
+                if view[offset : offset + len(chunk)] != chunk:
+                    return False
+                offset += len(chunk)
+    except FileNotFoundError:
+        return False
+
+    return offset == len(expected)
+
+
+def diff_outputs(outputs: dict[Path, bytes]) -> list[Path]:
     dirty: list[Path] = []
     for path, expected in outputs.items():
-        try:
-            current = path.read_text(encoding="utf-8")
-        except FileNotFoundError:
-            current = None
-
-        if current != expected:
+        if not matches_file(path, expected):
             dirty.append(path)
 
     return dirty
 
 
-def write_outputs(outputs: dict[Path, str]) -> None:
+def write_outputs(outputs: dict[Path, bytes]) -> None:
     for path, body in outputs.items():
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(body, encoding="utf-8")
+        write_file_atomically(path, body)
+
+
+def write_file_atomically(path: Path, body: bytes) -> None:
+    # 同じディレクトリの一意な一時ファイルに書いてから置き換える。並行実行でも一時ファイルが衝突せず、
+    # 失敗時は一時ファイルを消してから例外を再送出する。
+    handle = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    tmp_path = Path(handle.name)
+    try:
+        with handle:
+            handle.write(body)
+        # NamedTemporaryFile は 0600 で作られるため、通常の書き込みと同じく umask に従わせる。
+        os.chmod(tmp_path, 0o666 & ~current_umask())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def current_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def output_cache_key(source: bytes) -> str:
+    # 生成結果は用語台帳と本スクリプト自身だけで決まるため、両者の内容をキーにする。
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(source)
+    return digest.hexdigest()[:16]
+
+
+def resolve_cache_dir() -> Path | None:
+    # XDG Base Directory 仕様に従い、相対パスの XDG_CACHE_HOME は無視する。
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME", "")
+    if xdg_cache_home and os.path.isabs(xdg_cache_home):
+        return Path(xdg_cache_home) / CACHE_DIR_NAME
+    try:
+        return Path.home() / ".cache" / CACHE_DIR_NAME
+    except (RuntimeError, KeyError, OSError):
+        # HOME 未設定かつ passwd エントリのない uid（docker --user など）ではキャッシュを使わない。
+        return None
+
+
+def render_cached(
+    cache_key: str, suffix: str, render: Callable[[dict[str, Any]], str], payload: dict[str, Any]
+) -> bytes:
+    # 比較・書き込み・キャッシュはすべて bytes で扱い、UTF-8 への変換は描画直後の 1 回に限る。
+    cache_dir = resolve_cache_dir()
+    if cache_dir is None:
+        return render(payload).encode("utf-8")
+
+    cache_path = cache_dir / f"{cache_key}{suffix}"
+    body = load_cached_output(cache_path)
+    if body is None:
+        body = render(payload).encode("utf-8")
+        store_cached_output(cache_path, body)
+    return body
+
+
+def load_cached_output(cache_path: Path) -> bytes | None:
+    try:
+        return cache_path.read_bytes()
+    except OSError:
+        return None
+
+
+def store_cached_output(cache_path: Path, body: bytes) -> None:
+    # キャッシュは補助的なものなので、書き込めない環境では黙って諦める。
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_file_atomically(cache_path, body)
+        prune_cached_outputs(cache_path.parent, cache_path.stem)
+    except OSError:
+        pass
+
+
+def prune_cached_outputs(cache_dir: Path, keep_key: str) -> None:
+    # 入力が変わるたびに古いキーの生成物が残り続けないよう、現在のキー以外を消す。
+    for entry in cache_dir.iterdir():
+        if CACHE_ENTRY_PATTERN.match(entry.name) and not entry.name.startswith(f"{keep_key}."):
+            entry.unlink(missing_ok=True)
 
 
 def main() -> int:
@@ -401,15 +755,20 @@ def main() -> int:
     parser.add_argument("--check", action="store_true", help="差分がある場合に非0終了")
     args = parser.parse_args()
 
+    # 描画とキャッシュキーが同じ内容を見るよう、用語台帳は 1 回だけ読む。
     try:
-        payload = load_terms_file(TERMS_FILE)
+        source = read_terms_file(TERMS_FILE)
+        payload = load_terms_bytes(source, TERMS_FILE)
     except ValueError as exc:
         print(str(exc), file=sys.stderr)
         return 1
 
+    cache_key = output_cache_key(source)
+    # glossary.md も term 単位のメモ化ではなくファイル単位でキャッシュする。term は 1 実行で
+    # 1 回しか描画されないため、実行をまたいで再利用できる単位でなければ効果がない。
     outputs = {
-        GLOSSARY_MD: render_glossary_markdown(payload),
-        TERMS_JS: render_terms_script(payload),
+        GLOSSARY_MD: render_cached(cache_key, ".md", render_glossary_markdown, payload),
+        TERMS_JS: render_cached(cache_key, ".js", render_terms_script, payload),
     }
 
     dirty = diff_outputs(outputs)
@@ -422,9 +781,13 @@ def main() -> int:
             return 1
         return 0
 
-    write_outputs(outputs)
+    # 差分のないファイルは書き換えず、mtime を保って下流の再ビルドを起こさない。
+    write_outputs({path: outputs[path] for path in dirty})
     for path in outputs:
-        print(f"generated: {path}")
+        if path in dirty:
+            print(f"generated: {path}")
+        else:
+            print(f"unchanged: {path}")
     return 0
 
 